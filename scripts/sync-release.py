@@ -17,34 +17,116 @@ Features:
     - Comprehensive error handling and logging
 """
 
+from __future__ import annotations
+
 import argparse
+import asyncio
+import atexit
 import hashlib
-import json
 import logging
+import logging.handlers
+import mmap
 import os
-import requests
-import shutil
+import queue
+import random
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlparse
 
-# Configure logging
+# aiofiles and httpx are imported lazily where used so a bare --help
+# or argument error doesn't pay their startup cost
+
+# Configure logging; file writes go through a queue so log disk I/O
+# happens on a background thread instead of the transfer hot path
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+
+_file_handler = logging.FileHandler('sync-release.log', mode='a')
+_file_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('sync-release.log', mode='a')
+        _stream_handler,
+        logging.handlers.QueueHandler(_log_queue)
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Release JSON bigger than this is stream-parsed instead of loaded whole
+_STREAM_PARSE_THRESHOLD = 1 << 20
+
+# Top-level release fields the sync actually reads
+_RELEASE_FIELDS = frozenset({'tag_name', 'name', 'body', 'prerelease', 'draft', 'assets'})
+
 class GitHubAPIError(Exception):
     """Custom exception for GitHub API errors."""
     pass
 
+def _sha256_file(path: str) -> Tuple[str, str]:
+    """Compute the SHA256 digest of a file, returning (filename, hexdigest)."""
+    with open(path, "rb") as f:
+        # hashlib.file_digest (3.11+) runs the read/update loop in C
+        # on OpenSSL's accelerated SHA-256 path (SHA-NI where the CPU
+        # has it)
+        if hasattr(hashlib, 'file_digest'):
+            return Path(path).name, hashlib.file_digest(f, 'sha256').hexdigest()
+
+        # Older Pythons: memory-map the file so hashing is a single C
+        # call with no per-chunk Python loop or bytes allocations
+        # (mmap rejects empty files, so hash those directly)
+        if os.fstat(f.fileno()).st_size == 0:
+            return Path(path).name, hashlib.sha256(b"").hexdigest()
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return Path(path).name, hashlib.sha256(mm).hexdigest()
+
+def _iter_file(path: Path, chunk_size: int = 1 << 20):
+    """Yield a file's contents in fixed-size chunks for streaming uploads."""
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+async def _aiter_file(path: Path, chunk_size: int = 1 << 20):
+    """Async variant of _iter_file for uploads over the async client."""
+    import aiofiles
+
+    async with aiofiles.open(path, 'rb') as f:
+        while chunk := await f.read(chunk_size):
+            yield chunk
+
+class _ChunkReader:
+    """Minimal file-like adapter over an iterator of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b''
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            data = self._buffer + b''.join(self._chunks)
+            self._buffer = b''
+            return data
+
+        while len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
 class ReleaseSyncer:
     """Main class for synchronizing releases between repositories."""
     
@@ -52,65 +134,188 @@ class ReleaseSyncer:
         self.private_repo = private_repo
         self.public_repo = public_repo
         self.token = token
-        self.session = self._create_session()
+        self.client = self._create_client()
+        self._digests: Dict[str, str] = {}
+        self._etag_cache: Dict[str, Tuple[str, httpx.Response]] = {}
+        self._get_cache: Dict[str, httpx.Response] = {}
         
-        logger.info(f"Initialized ReleaseSyncer: {private_repo} -> {public_repo}")
+        logger.info("Initialized ReleaseSyncer: %s -> %s", private_repo, public_repo)
     
-    def _create_session(self) -> requests.Session:
-        """Create configured requests session with authentication."""
-        session = requests.Session()
-        session.headers.update({
-            'Authorization': f'token {self.token}',
-            'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'ReleaseSyncer/1.0'
-        })
-        return session
+    def _create_client(self) -> httpx.Client:
+        """Create configured httpx client with authentication."""
+        import httpx
+
+        # HTTP/2 multiplexes concurrent API calls over one keep-alive
+        # connection instead of one in-flight request per socket. The
+        # transport retries connection-level failures (resets, DNS);
+        # status-based retries live in _make_request
+        limits = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+
+        return httpx.Client(
+            headers={
+                'Authorization': f'token {self.token}',
+                'Accept': 'application/vnd.github.v3+json',
+                'User-Agent': 'ReleaseSyncer/1.0'
+            },
+            timeout=httpx.Timeout(None, connect=30.0),
+            follow_redirects=True,
+            transport=httpx.HTTPTransport(retries=3, http2=True, limits=limits)
+        )
     
-    def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make HTTP request with retry logic and rate limiting."""
-        max_retries = 3
+    def _make_request(self, method: str, url: str,
+                      ok_statuses: Tuple[int, ...] = (), stream: bool = False,
+                      **kwargs) -> httpx.Response:
+        """Make HTTP request with retry logic and rate limiting.
+
+        Statuses listed in ok_statuses are returned to the caller
+        instead of raising, for endpoints where an error reply is an
+        expected answer. With stream=True the response body is left
+        unread for the caller to consume.
+        """
+        import httpx
+
+        if method == 'GET':
+            # Repeat GETs within one sync are served from memory; the
+            # cache is dropped whenever a mutating request goes out
+            cached = self._get_cache.get(url)
+            if cached is not None:
+                logger.debug("Reusing cached response for %s", url)
+                return cached
+
+            # Conditional GET: a 304 reply carries no body and does not
+            # count against the API rate limit
+            if url in self._etag_cache:
+                kwargs.setdefault('headers', {})['If-None-Match'] = self._etag_cache[url][0]
+        else:
+            self._get_cache.clear()
+
+        attempt = 0
         base_delay = 1
-        
-        for attempt in range(max_retries):
+        while True:
             try:
-                response = self.session.request(method, url, **kwargs)
-                
-                # Handle rate limiting
-                if response.status_code == 429:
-                    reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                    if reset_time:
-                        wait_time = max(reset_time - int(time.time()), 60)
-                        logger.warning(f"Rate limited. Waiting {wait_time} seconds...")
-                        time.sleep(wait_time)
-                        continue
-                
+                request = self.client.build_request(method, url, **kwargs)
+                response = self.client.send(request, stream=stream)
+
+                if method == 'GET' and response.status_code == 304:
+                    logger.debug("Using cached response for %s (304 Not Modified)", url)
+                    response.close()
+                    self._get_cache[url] = self._etag_cache[url][1]
+                    return self._etag_cache[url][1]
+
+                # Connection-establishment failures are retried by the
+                # transport; rate limits, server errors, and mid-stream
+                # transport failures are handled here
+                if (response.status_code == 429 or
+                        (response.status_code == 403 and
+                         response.headers.get('X-RateLimit-Remaining') == '0')):
+                    wait_time = None
+                    retry_after = response.headers.get('Retry-After')
+                    if retry_after:
+                        try:
+                            wait_time = int(retry_after)
+                        except ValueError:
+                            # Retry-After can also be an HTTP-date; fall
+                            # through to the rate-limit reset timestamp
+                            pass
+
+                    if wait_time is None:
+                        reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+                        wait_time = max(reset_time - int(time.time()), 60) if reset_time else 60
+
+                    logger.warning("Rate limited. Waiting %s seconds...", wait_time)
+                    response.close()
+                    time.sleep(wait_time)
+                    continue
+
+                if response.status_code >= 500 and attempt < 3:
+                    attempt += 1
+                    # Jitter the backoff so parallel syncs don't retry
+                    # in lockstep
+                    delay = base_delay * (2 ** attempt) + random.uniform(0, base_delay)
+                    logger.warning("Server error %s, retrying in %.1fs...",
+                                   response.status_code, delay)
+                    response.close()
+                    time.sleep(delay)
+                    continue
+
+                if response.status_code in ok_statuses:
+                    return response
+
                 response.raise_for_status()
+
+                # Streamed bodies may be consumed by the caller, so
+                # they cannot be served from cache later
+                if method == 'GET' and not stream:
+                    self._get_cache[url] = response
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        self._etag_cache[url] = (etag, response)
+
                 return response
-                
-            except requests.exceptions.RequestException as e:
-                if attempt == max_retries - 1:
-                    raise GitHubAPIError(f"Request failed after {max_retries} attempts: {e}")
-                
-                delay = base_delay * (2 ** attempt)
-                logger.warning(f"Request failed (attempt {attempt + 1}), retrying in {delay}s: {e}")
+
+            except httpx.TransportError as e:
+                # The transport's retries only cover establishing the
+                # connection; read timeouts, resets, and protocol errors
+                # mid-request land here and get the same bounded backoff
+                if attempt >= 3:
+                    raise GitHubAPIError(f"Request failed after {attempt} retries: {e}")
+
+                attempt += 1
+                delay = base_delay * (2 ** attempt) + random.uniform(0, base_delay)
+                logger.warning("Transport error (attempt %s), retrying in %.1fs: %s",
+                               attempt, delay, e)
                 time.sleep(delay)
-    
+
+            except httpx.HTTPError as e:
+                raise GitHubAPIError(f"Request failed: {e}")
+
     def get_release_info(self, tag: Optional[str] = None) -> Dict:
         """Get release information from private repository."""
         if tag:
             url = f"https://api.github.com/repos/{self.private_repo}/releases/tags/{tag}"
-            logger.info(f"Fetching release info for tag: {tag}")
+            logger.info("Fetching release info for tag: %s", tag)
         else:
             url = f"https://api.github.com/repos/{self.private_repo}/releases/latest"
             logger.info("Fetching latest release info")
         
-        response = self._make_request('GET', url)
-        release_info = response.json()
-        
-        logger.info(f"Found release: {release_info['name']} ({release_info['tag_name']})")
-        logger.info(f"Assets: {len(release_info['assets'])} files")
-        
+        response = self._make_request('GET', url, stream=True)
+        release_info = self._parse_release_json(response)
+
+        logger.info("Found release: %s (%s)", release_info['name'], release_info['tag_name'])
+        logger.info("Assets: %s files", len(release_info['assets']))
+
         return release_info
+
+    def _parse_release_json(self, response: httpx.Response) -> Dict:
+        """Parse a release response, streaming the JSON when it is huge.
+
+        Small payloads (the common case) go through response.json().
+        Past the size threshold, ijson parses straight off the wire so
+        parsing overlaps the network read and only the top-level fields
+        the sync uses are kept; ijson is optional, so its absence just
+        means falling back to the one-shot parse.
+        """
+        content_length = int(response.headers.get('Content-Length') or 0)
+
+        if content_length > _STREAM_PARSE_THRESHOLD:
+            try:
+                import ijson
+            except ImportError:
+                logger.debug("ijson not available; parsing %s bytes in one shot",
+                             content_length)
+            else:
+                # iter_bytes yields decoded chunks; adapt it to the
+                # file-like interface ijson expects
+                try:
+                    return {key: value
+                            for key, value in ijson.kvitems(
+                                _ChunkReader(response.iter_bytes()), '')
+                            if key in _RELEASE_FIELDS}
+                finally:
+                    response.close()
+
+        response.read()
+        return response.json()
     
     def check_public_release_exists(self, tag: str) -> bool:
         """Check if release already exists in public repository."""
@@ -118,75 +323,209 @@ class ReleaseSyncer:
         
         try:
             response = self._make_request('GET', url)
-            logger.info(f"Release {tag} already exists in public repository")
+            logger.info("Release %s already exists in public repository", tag)
             return True
         except GitHubAPIError:
-            logger.info(f"Release {tag} does not exist in public repository")
+            logger.info("Release %s does not exist in public repository", tag)
             return False
     
     def download_release_assets(self, release_info: Dict, download_dir: Path) -> List[Path]:
         """Download all assets from the private repository release."""
         download_dir.mkdir(exist_ok=True)
-        downloaded_files = []
-        
+
         if not release_info['assets']:
             logger.info("No assets to download")
+            return []
+
+        return asyncio.run(self._download_assets_async(release_info['assets'], download_dir))
+
+    async def _download_assets_async(self, assets: List[Dict], download_dir: Path,
+                                     upload_url: Optional[str] = None,
+                                     max_files: int = 8, max_uploads: int = 4,
+                                     chunk_size: int = 2 * 1024 * 1024) -> List[Path]:
+        """Download assets concurrently, streaming each to disk in chunks.
+
+        When upload_url is given, each asset is queued for upload as soon
+        as its download completes, so upload latency hides behind the
+        remaining downloads instead of adding to the total wall time.
+        """
+        import httpx
+
+        semaphore = asyncio.Semaphore(max_files)
+        timeout = httpx.Timeout(None, connect=30.0)
+
+        # Cap the connection pool at the download + upload worker count
+        # so concurrency stays bounded even if limits are raised later
+        limits = httpx.Limits(max_connections=max_files + max_uploads)
+        total = len(assets)
+
+        # Headers are identical for every asset; build them once
+        headers = {
+            'Authorization': f'token {self.token}',
+            'Accept': 'application/octet-stream'
+        }
+
+        async with httpx.AsyncClient(http2=True, timeout=timeout, limits=limits,
+                                     follow_redirects=True) as client:
+            upload_queue = None
+            uploaders = []
+            upload_errors: List[Exception] = []
+
+            if upload_url:
+                upload_queue = asyncio.Queue()
+                uploaders = [
+                    asyncio.create_task(
+                        self._upload_worker(client, upload_queue, upload_url, upload_errors))
+                    for _ in range(max_uploads)
+                ]
+
+            tasks = [
+                self._download_asset(client, semaphore, asset, i, total, headers,
+                                     download_dir, chunk_size, upload_queue)
+                for i, asset in enumerate(assets, 1)
+            ]
+            downloaded_files = list(await asyncio.gather(*tasks))
+
+            if upload_queue is not None:
+                await upload_queue.join()
+                for uploader in uploaders:
+                    uploader.cancel()
+                await asyncio.gather(*uploaders, return_exceptions=True)
+
+                if upload_errors:
+                    raise upload_errors[0]
+
             return downloaded_files
-        
-        for i, asset in enumerate(release_info['assets'], 1):
-            asset_url = asset['url']
-            asset_name = asset['name']
-            asset_size = asset['size']
-            
-            logger.info(f"Downloading asset {i}/{len(release_info['assets'])}: {asset_name} ({asset_size} bytes)")
-            
-            # Download with proper headers for GitHub API
-            headers = {
-                'Authorization': f'token {self.token}',
-                'Accept': 'application/octet-stream'
-            }
-            
-            response = requests.get(asset_url, headers=headers, stream=True)
-            response.raise_for_status()
-            
-            file_path = download_dir / asset_name
-            
-            # Download with progress tracking for large files
-            with open(file_path, 'wb') as f:
-                downloaded = 0
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+
+    async def _upload_worker(self, client: httpx.AsyncClient,
+                             queue: asyncio.Queue, upload_url: str,
+                             errors: List[Exception]):
+        """Consume finished downloads from the queue and upload them."""
+        while True:
+            file_path = await queue.get()
+            try:
+                await self._upload_asset_async(client, upload_url, file_path)
+            except Exception as e:
+                logger.error("Failed to upload %s: %s", file_path.name, e)
+                errors.append(e)
+            finally:
+                queue.task_done()
+
+    async def _upload_asset_async(self, client: httpx.AsyncClient,
+                                  upload_url: str, asset_file: Path):
+        """Upload a single asset over the shared async client."""
+        file_size = asset_file.stat().st_size
+
+        headers = {
+            'Authorization': f'token {self.token}',
+            'Content-Type': 'application/octet-stream',
+            'Content-Length': str(file_size)
+        }
+        params = {'name': asset_file.name}
+
+        logger.info("Uploading asset: %s (%s bytes)", asset_file.name, file_size)
+
+        response = await client.post(upload_url, headers=headers, params=params,
+                                     content=_aiter_file(asset_file))
+        response.raise_for_status()
+
+        logger.info("📤 Uploaded: %s", asset_file.name)
+
+    async def _download_asset(self, client: httpx.AsyncClient,
+                              semaphore: asyncio.Semaphore, asset: Dict,
+                              index: int, total: int, headers: Dict,
+                              download_dir: Path, chunk_size: int,
+                              upload_queue: Optional[asyncio.Queue] = None) -> Path:
+        """Download a single asset under the concurrency limit."""
+        asset_url = asset['url']
+        asset_name = asset['name']
+        asset_size = asset['size']
+
+        file_path = download_dir / asset_name
+
+        async with semaphore:
+            logger.info("Downloading asset %s/%s: %s (%s bytes)", index, total, asset_name, asset_size)
+
+            async with client.stream('GET', asset_url, headers=headers) as response:
+                response.raise_for_status()
+
+                # Download with progress tracking for large files,
+                # hashing chunks as they arrive so the checksum phase
+                # never has to re-read the file from disk. Writing
+                # through a pre-allocated low-level fd keeps the file
+                # in one extent and skips the buffered writer's copy.
+                # Stream into a .part file and rename on success so a
+                # crash never leaves a truncated asset behind
+                part_path = download_dir / (asset_name + '.part')
+                sha256_hash = hashlib.sha256()
+                fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    if asset_size:
+                        if hasattr(os, 'posix_fallocate'):
+                            os.posix_fallocate(fd, 0, asset_size)
+                        else:
+                            os.ftruncate(fd, asset_size)
+
+                    downloaded = 0
+                    last_print = time.monotonic()
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        sha256_hash.update(chunk)
+                        os.write(fd, chunk)
                         downloaded += len(chunk)
-                        
-                        # Show progress for large files
+
+                        # Show progress for large files, at most twice a
+                        # second so fast links aren't slowed by stdout
                         if asset_size > 1024 * 1024:  # 1MB
-                            progress = (downloaded / asset_size) * 100
-                            print(f"\r  Progress: {progress:.1f}%", end='', flush=True)
-            
+                            now = time.monotonic()
+                            if now - last_print > 0.5:
+                                progress = (downloaded / asset_size) * 100
+                                print(f"\r  Progress: {progress:.1f}%", end='', flush=True)
+                                last_print = now
+
+                    # Trim the pre-allocation if the server sent fewer
+                    # bytes than the advertised asset size
+                    if downloaded != asset_size:
+                        os.ftruncate(fd, downloaded)
+                finally:
+                    os.close(fd)
+
+            os.replace(part_path, file_path)
+
             if asset_size > 1024 * 1024:
                 print()  # New line after progress
-            
-            downloaded_files.append(file_path)
-            logger.info(f"✅ Downloaded: {asset_name}")
-        
-        return downloaded_files
+
+            self._digests[asset_name] = sha256_hash.hexdigest()
+            logger.info("✅ Downloaded: %s", asset_name)
+
+        if upload_queue is not None:
+            upload_queue.put_nowait(file_path)
+
+        return file_path
     
     def generate_checksums(self, files: List[Path]) -> Dict[str, str]:
         """Generate SHA256 checksums for downloaded files."""
         checksums = {}
-        
+
+        # Digests are computed while the assets stream to disk, so this
+        # is normally a lookup; only files we didn't download ourselves
+        # need to be read back and hashed
+        missing = []
         for file_path in files:
-            if file_path.is_file():
-                logger.info(f"Generating checksum for {file_path.name}")
-                
-                sha256_hash = hashlib.sha256()
-                with open(file_path, "rb") as f:
-                    for chunk in iter(lambda: f.read(4096), b""):
-                        sha256_hash.update(chunk)
-                
-                checksums[file_path.name] = sha256_hash.hexdigest()
-        
+            if not file_path.is_file():
+                continue
+            if file_path.name in self._digests:
+                checksums[file_path.name] = self._digests[file_path.name]
+            else:
+                missing.append(str(file_path))
+
+        if missing:
+            logger.info("Generating checksums for %s files", len(missing))
+
+            # hashlib releases the GIL while hashing the mapped file,
+            # so threads overlap fully without process spawn overhead
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                checksums.update(executor.map(_sha256_file, missing))
+
         return checksums
     
     def create_checksums_file(self, files: List[Path], output_dir: Path) -> Path:
@@ -198,7 +537,7 @@ class ReleaseSyncer:
             for filename, checksum in sorted(checksums.items()):
                 f.write(f"{checksum}  {filename}\n")
         
-        logger.info(f"Created checksums file with {len(checksums)} entries")
+        logger.info("Created checksums file with %s entries", len(checksums))
         return checksums_file
     
     def delete_public_release(self, tag: str) -> bool:
@@ -215,27 +554,17 @@ class ReleaseSyncer:
             delete_url = f"https://api.github.com/repos/{self.public_repo}/releases/{release_id}"
             self._make_request('DELETE', delete_url)
             
-            logger.info(f"Deleted existing release {tag} from public repository")
+            logger.info("Deleted existing release %s from public repository", tag)
             return True
             
         except GitHubAPIError as e:
-            logger.error(f"Failed to delete existing release: {e}")
+            logger.error("Failed to delete existing release: %s", e)
             return False
     
-    def create_public_release(self, release_info: Dict, asset_files: List[Path], 
-                            force: bool = False) -> str:
-        """Create release in public repository with assets."""
+    def create_public_release(self, release_info: Dict, force: bool = False) -> Dict:
+        """Create release in public repository and return its metadata."""
         tag_name = release_info['tag_name']
-        
-        # Check if release exists
-        if self.check_public_release_exists(tag_name):
-            if not force:
-                raise GitHubAPIError(f"Release {tag_name} already exists in public repository. Use --force to overwrite.")
-            else:
-                logger.info("Force flag enabled, deleting existing release...")
-                if not self.delete_public_release(tag_name):
-                    raise GitHubAPIError("Failed to delete existing release")
-        
+
         # Create the release
         release_data = {
             'tag_name': release_info['tag_name'],
@@ -244,79 +573,97 @@ class ReleaseSyncer:
             'prerelease': release_info['prerelease'],
             'draft': release_info['draft']
         }
-        
-        logger.info(f"Creating release {tag_name} in public repository...")
-        
+
+        logger.info("Creating release %s in public repository...", tag_name)
+
         url = f"https://api.github.com/repos/{self.public_repo}/releases"
-        response = self._make_request('POST', url, json=release_data)
+
+        # POST first instead of pre-checking existence; GitHub answers
+        # 422 already_exists when the tag is taken, so the common path
+        # costs a single round-trip
+        response = self._make_request('POST', url, json=release_data, ok_statuses=(422,))
+
+        if response.status_code == 422:
+            errors = response.json().get('errors', [])
+            if not any(error.get('code') == 'already_exists' for error in errors):
+                raise GitHubAPIError(f"Failed to create release {tag_name}: {response.text}")
+
+            if not force:
+                raise GitHubAPIError(f"Release {tag_name} already exists in public repository. Use --force to overwrite.")
+
+            logger.info("Force flag enabled, deleting existing release...")
+            if not self.delete_public_release(tag_name):
+                raise GitHubAPIError("Failed to delete existing release")
+
+            response = self._make_request('POST', url, json=release_data)
+
         public_release = response.json()
-        
-        logger.info(f"✅ Created release: {public_release['html_url']}")
-        
-        # Upload each asset
-        if asset_files:
-            upload_url = public_release['upload_url'].replace('{?name,label}', '')
-            
-            for i, asset_file in enumerate(asset_files, 1):
-                logger.info(f"Uploading asset {i}/{len(asset_files)}: {asset_file.name}")
-                self.upload_asset(upload_url, asset_file)
-        
-        return public_release['html_url']
+
+        logger.info("✅ Created release: %s", public_release['html_url'])
+
+        return public_release
     
     def upload_asset(self, upload_url: str, asset_file: Path):
         """Upload a single asset to the public release."""
         file_size = asset_file.stat().st_size
         
-        with open(asset_file, 'rb') as f:
-            headers = {
-                'Authorization': f'token {self.token}',
-                'Content-Type': 'application/octet-stream',
-                'Content-Length': str(file_size)
-            }
-            params = {'name': asset_file.name}
-            
-            # For large files, show upload progress
-            if file_size > 1024 * 1024:  # 1MB
-                logger.info(f"Uploading large file: {asset_file.name} ({file_size} bytes)")
-            
-            response = requests.post(upload_url, headers=headers, params=params, data=f)
-            response.raise_for_status()
+        headers = {
+            'Content-Type': 'application/octet-stream',
+            'Content-Length': str(file_size)
+        }
+        params = {'name': asset_file.name}
+
+        # For large files, show upload progress
+        if file_size > 1024 * 1024:  # 1MB
+            logger.info("Uploading large file: %s (%s bytes)", asset_file.name, file_size)
+
+        # Stream the body in 1 MiB chunks so memory stays bounded
+        # regardless of asset size
+        response = self.client.post(upload_url, headers=headers, params=params,
+                                    content=_iter_file(asset_file))
+        response.raise_for_status()
             
-        logger.info(f"📤 Uploaded: {asset_file.name}")
+        logger.info("📤 Uploaded: %s", asset_file.name)
     
     def sync_release(self, tag: Optional[str] = None, force: bool = False) -> str:
         """Main synchronization method."""
-        logger.info(f"🔄 Starting release sync: {self.private_repo} -> {self.public_repo}")
+        logger.info("🔄 Starting release sync: %s -> %s", self.private_repo, self.public_repo)
         
         try:
             # Get release info
             release_info = self.get_release_info(tag)
             sync_tag = release_info['tag_name']
-            
-            # Download assets
-            download_dir = Path("temp_assets")
-            try:
-                asset_files = self.download_release_assets(release_info, download_dir)
-                
-                # Create checksums file if we have assets
+
+            # Create the public release up front so the upload URL is
+            # known before downloads start, then pipeline the two phases:
+            # each asset is uploaded as soon as its download finishes.
+            # Assets stream into a per-run OS temp directory, so
+            # concurrent syncs cannot collide and cleanup is handled by
+            # the context manager even on failure
+            with tempfile.TemporaryDirectory(prefix="sync-release-") as temp_dir:
+                download_dir = Path(temp_dir)
+
+                public_release = self.create_public_release(release_info, force)
+                public_url = public_release['html_url']
+                upload_url = public_release['upload_url'].replace('{?name,label}', '')
+
+                if release_info['assets']:
+                    asset_files = asyncio.run(self._download_assets_async(
+                        release_info['assets'], download_dir, upload_url=upload_url))
+                else:
+                    logger.info("No assets to download")
+                    asset_files = []
+
+                # Create and upload checksums file if we have assets
                 if asset_files:
                     checksums_file = self.create_checksums_file(asset_files, download_dir)
-                    asset_files.append(checksums_file)
-                
-                # Create public release
-                public_url = self.create_public_release(release_info, asset_files, force)
-                
-                logger.info(f"✅ Successfully synced release: {public_url}")
+                    self.upload_asset(upload_url, checksums_file)
+
+                logger.info("✅ Successfully synced release: %s", public_url)
                 return public_url
-                
-            finally:
-                # Cleanup
-                if download_dir.exists():
-                    shutil.rmtree(download_dir)
-                    logger.info("🧹 Cleaned up temporary files")
-                    
+
         except Exception as e:
-            logger.error(f"❌ Sync failed: {e}")
+            logger.error("❌ Sync failed: %s", e)
             raise
 
 def parse_arguments():
@@ -377,7 +724,7 @@ def main():
     # Validate repository format
     for repo in [args.private_repo, args.public_repo]:
         if '/' not in repo:
-            logger.error(f"❌ Error: Invalid repository format '{repo}'. Use 'owner/repo' format.")
+            logger.error("❌ Error: Invalid repository format '%s'. Use 'owner/repo' format.", repo)
             sys.exit(1)
     
     if args.dry_run:
@@ -392,10 +739,10 @@ def main():
             release_info = syncer.get_release_info(tag)
             
             logger.info("🔍 Dry run - would sync:")
-            logger.info(f"   Tag: {release_info['tag_name']}")
-            logger.info(f"   Name: {release_info['name']}")
-            logger.info(f"   Assets: {len(release_info['assets'])}")
-            logger.info(f"   Prerelease: {release_info['prerelease']}")
+            logger.info("   Tag: %s", release_info['tag_name'])
+            logger.info("   Name: %s", release_info['name'])
+            logger.info("   Assets: %s", len(release_info['assets']))
+            logger.info("   Prerelease: %s", release_info['prerelease'])
             
             if syncer.check_public_release_exists(release_info['tag_name']):
                 if args.force:
@@ -415,7 +762,7 @@ def main():
         logger.info("⏹️ Sync cancelled by user")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"❌ Error: {e}")
+        logger.error("❌ Error: %s", e)
         sys.exit(1)
 
 if __name__ == '__main__':